@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 import logging
+from collections import ChainMap
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 
-from .api import WeWorkAppClient, WeWorkBotClient, WeWorkError
+from .api import (
+    WeWorkAppClient,
+    WeWorkBotClient,
+    WeWorkError,
+    async_remove_token_store,
+)
 from .const import (
     CONF_AGENT_ID,
     CONF_CORP_ID,
@@ -38,24 +46,24 @@ from .const import (
     DOMAIN,
     ENTRY_TYPE_APP,
     ENTRY_TYPE_BOT,
-    MESSAGE_TYPE_MARKDOWN,
     MESSAGE_TYPE_TEXT,
-    MESSAGE_TYPE_IMAGE,
     SERVICE_SEND_MESSAGE,
+    SUPPORTED_MESSAGE_TYPES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 RUNTIME_CLIENT = "client"
+RUNTIME_TITLE_KEY = "title_key"
+
+DATA_TITLE_INDEX = "_title_index"
 
 SEND_MESSAGE_SCHEMA = vol.Schema(
     {
         vol.Exclusive(CONF_ENTRY_ID, "entry_ref"): cv.string,
         vol.Exclusive(CONF_ENTRY_TITLE, "entry_ref"): cv.string,
         vol.Exclusive(CONF_CONFIG_ENTRY, "entry_ref"): cv.string,
-        vol.Optional(CONF_MESSAGE_TYPE, default=MESSAGE_TYPE_TEXT): vol.In(
-            {MESSAGE_TYPE_TEXT, MESSAGE_TYPE_MARKDOWN, MESSAGE_TYPE_IMAGE}
-        ),
+        vol.Optional(CONF_MESSAGE_TYPE, default=MESSAGE_TYPE_TEXT): vol.In(SUPPORTED_MESSAGE_TYPES),
         vol.Optional(CONF_MESSAGE): cv.string,
         vol.Optional(CONF_TO_USER): cv.string,
         vol.Optional(CONF_TO_PARTY): cv.string,
@@ -65,7 +73,8 @@ SEND_MESSAGE_SCHEMA = vol.Schema(
         vol.Optional(CONF_IMAGE_MEDIA_ID): cv.string,
         vol.Optional(CONF_IMAGE_BASE64): cv.string,
         vol.Optional(CONF_IMAGE_MD5): cv.string,
-    }
+    },
+    extra=vol.REMOVE_EXTRA,
 )
 
 
@@ -91,21 +100,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             entry.data[CONF_CORP_SECRET],
             entry.data[CONF_AGENT_ID],
             defaults,
+            entry_id=entry.entry_id,
         )
+        try:
+            await client.async_load_token()
+        except BaseException:
+            # The client already owns an open session; don't leak it on failure.
+            await client.async_close()
+            raise
     else:
         client = WeWorkBotClient(hass, entry.data[CONF_WEBHOOK_KEY])
 
-    hass.data[DOMAIN][entry.entry_id] = {RUNTIME_CLIENT: client}
+    title_key = entry.title.lower()
+    hass.data[DOMAIN][entry.entry_id] = {RUNTIME_CLIENT: client, RUNTIME_TITLE_KEY: title_key}
+    # Loaded entries indexed by lowercased title; a title change reloads the entry.
+    title_index = hass.data[DOMAIN].setdefault(DATA_TITLE_INDEX, {})
+    title_index.setdefault(title_key, {})[entry.entry_id] = entry
+    entry.async_create_background_task(
+        hass, client.async_warm_up(), f"{DOMAIN} warm-up {entry.entry_id}"
+    )
 
-    if not hass.services.has_service(DOMAIN, SERVICE_SEND_MESSAGE):
+    async def async_close_client(_: Event) -> None:
+        await client.async_close()
 
-        async def async_handle_send_message(call: ServiceCall) -> None:
-            await _async_send_message(hass, call)
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_client)
+    )
 
+    if not hass.services.has_service(DOMAIN, SERVICE_SEND_MESSAGE):
         hass.services.async_register(
             DOMAIN,
             SERVICE_SEND_MESSAGE,
-            async_handle_send_message,
+            _async_handle_send_message,
             schema=SEND_MESSAGE_SCHEMA,
         )
 
@@ -119,19 +145,37 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     data = hass.data.get(DOMAIN, {})
     runtime = data.pop(entry.entry_id, None)
-    if runtime and RUNTIME_CLIENT in runtime:
-        await runtime[RUNTIME_CLIENT].async_close()
+    title_index = data.get(DATA_TITLE_INDEX, {})
+    if runtime:
+        title_key = runtime[RUNTIME_TITLE_KEY]
+        matches = title_index.get(title_key, {})
+        matches.pop(entry.entry_id, None)
+        if not matches:
+            title_index.pop(title_key, None)
+        if RUNTIME_CLIENT in runtime:
+            await runtime[RUNTIME_CLIENT].async_close()
 
-    if not data and hass.services.has_service(DOMAIN, SERVICE_SEND_MESSAGE):
+    if not title_index and hass.services.has_service(DOMAIN, SERVICE_SEND_MESSAGE):
         hass.services.async_remove(DOMAIN, SERVICE_SEND_MESSAGE)
 
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove data persisted for a deleted WeWork Notify config entry."""
+
+    if entry.data[CONF_ENTRY_TYPE] == ENTRY_TYPE_APP:
+        await async_remove_token_store(hass, entry.entry_id)
+
+
 async def _async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+async def _async_handle_send_message(call: ServiceCall) -> None:
+    await _async_send_message(call.hass, call)
+
+
 async def _async_send_message(hass: HomeAssistant, call: ServiceCall) -> None:
     entry = _resolve_entry(hass, call.data)
     runtime = hass.data[DOMAIN].get(entry.entry_id)
@@ -139,20 +183,22 @@ async def _async_send_message(hass: HomeAssistant, call: ServiceCall) -> None:
         raise HomeAssistantError("Entry runtime not initialized")
 
     client = runtime[RUNTIME_CLIENT]
-    payload = dict(call.data)
 
+    # Layer default recipients over the validated call data instead of copying it.
     defaults = _get_defaults(entry)
-    for target_key in (CONF_TO_USER, CONF_TO_PARTY, CONF_TO_TAG):
-        if payload.get(target_key) in (None, "") and defaults.get(target_key):
-            payload[target_key] = defaults[target_key]
+    overlay = {
+        target_key: defaults[target_key]
+        for target_key in (CONF_TO_USER, CONF_TO_PARTY, CONF_TO_TAG)
+        if call.data.get(target_key) in (None, "") and defaults.get(target_key)
+    }
 
     try:
-        await client.async_send_message(payload)
+        await client.async_send_message(ChainMap(overlay, call.data))
     except WeWorkError as err:
         raise HomeAssistantError(str(err)) from err
 
 
-def _resolve_entry(hass: HomeAssistant, data: dict[str, Any]) -> ConfigEntry:
+def _resolve_entry(hass: HomeAssistant, data: Mapping[str, Any]) -> ConfigEntry:
     config_entry = data.get(CONF_CONFIG_ENTRY)
     if config_entry:
         resolved_entry = hass.config_entries.async_get_entry(config_entry)
@@ -170,18 +216,14 @@ def _resolve_entry(hass: HomeAssistant, data: dict[str, Any]) -> ConfigEntry:
         return entry
 
     if entry_title:
-        matches = [
-            entry
-            for entry in hass.config_entries.async_entries(DOMAIN)
-            if entry.title.lower() == entry_title.lower()
-        ]
+        matches = hass.data[DOMAIN].get(DATA_TITLE_INDEX, {}).get(entry_title.lower())
         if not matches:
             raise HomeAssistantError(f"No entry found with title {entry_title}")
         if len(matches) > 1:
             raise HomeAssistantError(
                 "Multiple entries match the given title; please use entry_id instead"
             )
-        return matches[0]
+        return next(iter(matches.values()))
 
     raise HomeAssistantError("Either entry_id or entry_title must be provided")
 
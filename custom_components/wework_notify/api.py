@@ -3,18 +3,32 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import suppress
+from functools import partial
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from types import MappingProxyType
 from typing import Any
 
-from aiohttp import ClientError, ClientSession
+import orjson
+from aiohttp import ClientError, ClientSession, TCPConnector, hdrs
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONTENT_TYPE_JSON
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.util.ssl import get_default_context
 
 from .const import (
     API_BASE_URL,
+    APP_CONTENT_MAX_BYTES,
+    BATCH_MAX_SIZE,
+    BATCH_SEPARATOR,
+    BATCH_WAIT,
+    BOT_MARKDOWN_MAX_BYTES,
+    BOT_TEXT_MAX_BYTES,
     CONF_AGENT_ID,
     CONF_CORP_ID,
     CONF_CORP_SECRET,
@@ -28,16 +42,37 @@ from .const import (
     CONF_TO_PARTY,
     CONF_TO_TAG,
     CONF_TO_USER,
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    CONNECTION_LIMIT,
+    DEDUP_CACHE_SIZE,
+    DEDUP_WINDOW,
     DEFAULT_TIMEOUT,
+    DNS_CACHE_TTL,
+    DOMAIN,
     MESSAGE_TYPE_IMAGE,
     MESSAGE_TYPE_MARKDOWN,
     MESSAGE_TYPE_TEXT,
+    PAYLOAD_CACHE_SIZE,
     SUPPORTED_MESSAGE_TYPES,
+    TOKEN_REFRESH_AHEAD,
+    TOKEN_REFRESH_BACKOFF,
     TOKEN_RETRYABLE_ERROR_CODES,
+    TOKEN_STORAGE_VERSION,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_SEND_URL = f"{API_BASE_URL}/message/send"
+_TOKEN_URL = f"{API_BASE_URL}/gettoken"
+_WEBHOOK_URL = f"{API_BASE_URL}/webhook/send"
+
+_BATCHABLE_MESSAGE_TYPES = frozenset({MESSAGE_TYPE_TEXT, MESSAGE_TYPE_MARKDOWN})
+
+_BATCH_SEPARATOR_BYTES = len(BATCH_SEPARATOR.encode())
+
+# Default for _MessageBatcher.async_flush; robots use None as their only target.
+_ALL_TARGETS = object()
+
 
 class WeWorkError(HomeAssistantError):
     """Raised when the WeWork API returns an error."""
@@ -47,25 +82,253 @@ class WeWorkError(HomeAssistantError):
         self.errcode = errcode
 
 
+class _MessageBatcher:
+    """Coalesce text/markdown messages sent to the same target within a short window."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        self._hass = hass
+        self._send = send
+        self._pending: dict[
+            tuple[Hashable, Hashable], list[tuple[dict[str, Any], asyncio.Future[None]]]
+        ] = {}
+        self._sizes: dict[tuple[Hashable, Hashable], int] = {}
+        self._timers: dict[tuple[Hashable, Hashable], asyncio.TimerHandle] = {}
+        self._tasks: dict[asyncio.Task[None], tuple[Hashable, Hashable]] = {}
+
+    async def async_submit(
+        self,
+        target: Hashable,
+        variant: Hashable,
+        payload: dict[str, Any],
+        max_bytes: int,
+        future: asyncio.Future[None],
+    ) -> None:
+        """Queue a payload and wait until the batch containing it has been sent.
+
+        Payloads are batched per ``(target, variant)``: ``target`` identifies the
+        recipients and ``variant`` what else must match to share one message.
+        ``max_bytes`` is the WeCom cap on the joined content; a message that would
+        push the pending batch over it starts a new batch instead. ``future``
+        receives the outcome of the actual send, even if the caller is cancelled
+        after its batch has been handed over.
+        """
+        key = (target, variant)
+        size = len(payload[payload["msgtype"]]["content"].encode())
+        if size > max_bytes:
+            # Too long to share a message; send it after what is queued before it.
+            await self.async_flush(target)
+            await self._async_send_batch([(payload, future)])
+            await future
+            return
+
+        # Batches of another variant for this target hold earlier messages; start them first.
+        for other in [other for other in self._pending if other[0] == target and other != key]:
+            self._flush(other)
+        if key in self._pending and self._sizes[key] + _BATCH_SEPARATOR_BYTES + size > max_bytes:
+            self._flush(key)
+        if key in self._pending:
+            self._sizes[key] += _BATCH_SEPARATOR_BYTES + size
+        else:
+            self._sizes[key] = size
+
+        entry = (payload, future)
+        batch = self._pending.setdefault(key, [])
+        batch.append(entry)
+        if len(batch) >= BATCH_MAX_SIZE:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = self._hass.loop.call_later(BATCH_WAIT, self._flush, key)
+        try:
+            await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if self._discard(key, entry, size):
+                future.set_exception(WeWorkError("Message was cancelled before it was sent"))
+            raise
+
+    @callback
+    def _discard(
+        self,
+        key: tuple[Hashable, Hashable],
+        entry: tuple[dict[str, Any], asyncio.Future[None]],
+        size: int,
+    ) -> bool:
+        """Drop a cancelled caller's message if its batch has not been sent yet."""
+        batch = self._pending.get(key)
+        if batch is None or not any(queued is entry for queued in batch):
+            return False
+        batch.remove(entry)
+        if batch:
+            self._sizes[key] -= _BATCH_SEPARATOR_BYTES + size
+            return True
+        del self._pending[key]
+        self._sizes.pop(key, None)
+        if (timer := self._timers.pop(key, None)) is not None:
+            timer.cancel()
+        return True
+
+    async def async_flush(self, target: Hashable = _ALL_TARGETS) -> None:
+        """Send pending batches now and wait for batches already in flight.
+
+        Only batches for ``target`` are flushed when one is given.
+        """
+        for key in [key for key in self._pending if target in (_ALL_TARGETS, key[0])]:
+            if (timer := self._timers.pop(key, None)) is not None:
+                timer.cancel()
+            self._sizes.pop(key, None)
+            if batch := self._pending.pop(key, None):
+                await self._async_send_batch(batch)
+        if tasks := [
+            task for task, key in self._tasks.items() if target in (_ALL_TARGETS, key[0])
+        ]:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @callback
+    def _flush(self, key: tuple[Hashable, Hashable]) -> None:
+        if (timer := self._timers.pop(key, None)) is not None:
+            timer.cancel()
+        self._sizes.pop(key, None)
+        if batch := self._pending.pop(key, None):
+            task = self._hass.async_create_background_task(
+                self._async_send_batch(batch), "wework_notify send batch"
+            )
+            self._tasks[task] = key
+            task.add_done_callback(self._tasks.pop)
+
+    async def _async_send_batch(
+        self, batch: list[tuple[dict[str, Any], asyncio.Future[None]]]
+    ) -> None:
+        try:
+            await self._send(_merge_payloads([payload for payload, _ in batch]))
+        except asyncio.CancelledError:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(WeWorkError("Message send was cancelled"))
+            raise
+        except Exception as err:  # noqa: BLE001 - handed over to every waiting caller
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(err)
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+
 class BaseWeWorkClient:
     """Base class shared by WeWork clients."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         self._hass = hass
-        self._session: ClientSession | None = None
+        self._session = ClientSession(
+            connector=TCPConnector(
+                limit=CONNECTION_LIMIT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,
+                ssl=get_default_context(),
+            ),
+            json_serialize=_json_dumps,
+        )
+        self._batcher = _MessageBatcher(hass, self._async_send_payload)
+        self._recent_sends: OrderedDict[int, tuple[float, asyncio.Future[None]]] = OrderedDict()
 
     @property
     def session(self) -> ClientSession:
-        if self._session is None:
-            self._session = async_get_clientsession(self._hass, verify_ssl=True)
         return self._session
 
+    async def async_warm_up(self) -> None:
+        """Prime the DNS cache and open a TLS connection to the WeCom API."""
+        try:
+            async with asyncio.timeout(DEFAULT_TIMEOUT), self.session.head(API_BASE_URL):
+                pass
+        except (ClientError, TimeoutError) as err:
+            _LOGGER.debug("Connection warm-up failed: %s", err)
+
     async def async_close(self) -> None:
-        """No-op for compatibility."""
+        """Send pending and in-flight batches, then close the session."""
+        await self._batcher.async_flush()
+        await self._session.close()
 
-    async def async_send_message(self, data: dict[str, Any]) -> None:
+    async def async_send_message(self, data: Mapping[str, Any]) -> None:
         raise NotImplementedError
 
+    async def _async_send_payload(self, payload: dict[str, Any], body: bytes | None = None) -> None:
+        raise NotImplementedError
+
+    async def _async_dispatch(
+        self,
+        payload: dict[str, Any],
+        target: Hashable,
+        batch_variant: Hashable | None,
+        *,
+        max_bytes: int = 0,
+        fingerprint: int | None = None,
+        offload: bool = False,
+    ) -> None:
+        """Send a payload to ``target``, batching when ``batch_variant`` is given.
+
+        A payload identical to one dispatched within ``DEDUP_WINDOW`` is not sent
+        again; the caller waits for and shares the outcome of the original.
+        ``max_bytes`` caps the joined content of a batch. ``fingerprint`` replaces
+        the serialized payload as duplicate key, and ``offload`` serializes the
+        body in the executor.
+        """
+        if fingerprint is None:
+            fingerprint = hash(_json_dumps_sorted(payload))
+        if (original := self._recent_send(fingerprint)) is not None:
+            _LOGGER.debug("Message identical to one sent within %ss, sharing its result", DEDUP_WINDOW)
+            await asyncio.shield(original)
+            return
+
+        outcome: asyncio.Future[None] = self._hass.loop.create_future()
+        outcome.add_done_callback(partial(self._forget_failed_send, fingerprint))
+        self._recent_sends[fingerprint] = (time.monotonic(), outcome)
+        if len(self._recent_sends) > DEDUP_CACHE_SIZE:
+            self._recent_sends.popitem(last=False)
+
+        if batch_variant is not None:
+            await self._batcher.async_submit(target, batch_variant, payload, max_bytes, outcome)
+            return
+
+        try:
+            body = None
+            if offload:
+                body = await self._hass.async_add_executor_job(orjson.dumps, payload)
+            # Messages still batched for these recipients were sent first by the caller.
+            await self._batcher.async_flush(target)
+            await self._async_send_payload(payload, body)
+        except BaseException as err:
+            outcome.set_exception(
+                err if isinstance(err, WeWorkError) else WeWorkError("Identical message was not sent")
+            )
+            raise
+        outcome.set_result(None)
+
+    @callback
+    def _forget_failed_send(self, fingerprint: int, outcome: asyncio.Future[None]) -> None:
+        # Retrieving the exception also keeps asyncio from logging it when no
+        # duplicate is waiting.
+        if outcome.exception() is None:
+            return
+        # Let the caller retry a failed message straight away.
+        if self._recent_sends.get(fingerprint, (0, None))[1] is outcome:
+            del self._recent_sends[fingerprint]
+
+    @callback
+    def _recent_send(self, fingerprint: int) -> asyncio.Future[None] | None:
+        if (recent := self._recent_sends.get(fingerprint)) is None:
+            return None
+        sent_at, outcome = recent
+        if time.monotonic() - sent_at >= DEDUP_WINDOW:
+            return None
+        # A failed send is forgotten on the next loop iteration; don't share it meanwhile.
+        if outcome.done() and outcome.exception() is not None:
+            return None
+        return outcome
+
 
 class WeWorkAppClient(BaseWeWorkClient):
     """Client for sending messages via a WeCom custom application."""
@@ -77,6 +340,8 @@ class WeWorkAppClient(BaseWeWorkClient):
         corp_secret: str,
         agent_id: int,
         defaults: dict[str, str | None] | None = None,
+        *,
+        entry_id: str,
     ) -> None:
         super().__init__(hass)
         self._corp_id = corp_id
@@ -85,35 +350,70 @@ class WeWorkAppClient(BaseWeWorkClient):
         self._token: str | None = None
         self._token_expire_time: float = 0
         self._token_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[str | None] | None = None
+        self._refresh_scheduled_at: float | None = None
+        self._store = _token_store(hass, entry_id)
         self._defaults = defaults or {}
+        self._payload_cache: OrderedDict[
+            tuple[str, str | None, str | None, str | None], MappingProxyType[str, Any]
+        ] = OrderedDict()
+
+    async def async_load_token(self) -> None:
+        """Restore an access token persisted by a previous run if still valid."""
+        stored = await self._store.async_load()
+        if not stored or not stored.get("token"):
+            return
+        # Wall-clock expiry survives restarts; convert it back to the monotonic clock.
+        remaining = stored.get("exp_wall", 0) - time.time()
+        if remaining <= 30:
+            return
+        self._token = stored["token"]
+        self._token_expire_time = time.monotonic() + remaining
 
-    async def async_send_message(self, data: dict[str, Any]) -> None:
+    async def async_close(self) -> None:
+        """Send pending batches, stop the background token refresh and close the session."""
+        # Pending batches may still need a token, so drain them before cancelling.
+        await self._batcher.async_flush()
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._refresh_task
+        await super().async_close()
+
+    async def async_send_message(self, data: Mapping[str, Any]) -> None:
         message_type: str = data.get(CONF_MESSAGE_TYPE, MESSAGE_TYPE_TEXT)
         if message_type not in SUPPORTED_MESSAGE_TYPES:
             raise WeWorkError(f"Unsupported message type: {message_type}")
 
         payload = await self._build_payload(message_type, data)
-        token = await self._ensure_token()
+        target = (payload.get("touser"), payload.get("toparty"), payload.get("totag"))
+        batch_variant = message_type if message_type in _BATCHABLE_MESSAGE_TYPES else None
+        await self._async_dispatch(
+            payload, target, batch_variant, max_bytes=APP_CONTENT_MAX_BYTES
+        )
+
+    async def _async_send_payload(self, payload: dict[str, Any], body: bytes | None = None) -> None:
+        token = self._cached_token() or await self._refresh_token(force=False)
         try:
-            await self._do_send(payload, token)
+            await self._do_send(payload, token, body)
         except WeWorkError as err:
             if err.errcode not in TOKEN_RETRYABLE_ERROR_CODES:
                 raise
             _LOGGER.debug("Token invalid, refreshing and retrying: %s", err)
-            token = await self._refresh_token(force=True)
-            await self._do_send(payload, token)
+            token = await self._retry_token(token)
+            await self._do_send(payload, token, body)
 
-    async def _do_send(self, payload: dict[str, Any], token: str) -> None:
-        url = f"{API_BASE_URL}/message/send"
+    async def _do_send(self, payload: dict[str, Any], token: str, body: bytes | None = None) -> None:
         try:
-            async with self.session.post(
-                url,
+            async with asyncio.timeout(DEFAULT_TIMEOUT), self.session.post(
+                _SEND_URL,
                 params={"access_token": token},
-                json=payload,
-                timeout=DEFAULT_TIMEOUT,
+                **_body_kwargs(payload, body),
             ) as resp:
-                result = await resp.json()
-        except ClientError as err:
+                result = orjson.loads(await resp.read())
+        except TimeoutError as err:
+            raise WeWorkError("Timed out sending message") from err
+        except (ClientError, orjson.JSONDecodeError) as err:
             raise WeWorkError(f"Failed to send message: {err}") from err
 
         errcode = result.get("errcode")
@@ -121,9 +421,9 @@ class WeWorkAppClient(BaseWeWorkClient):
             errmsg = result.get("errmsg", "unknown error")
             raise WeWorkError(f"Message send failed: {errmsg}", errcode=errcode) from _WeWorkAPIError(errcode, errmsg)
 
-    async def _build_payload(self, message_type: str, data: dict[str, Any]) -> dict[str, Any]:
+    async def _build_payload(self, message_type: str, data: Mapping[str, Any]) -> dict[str, Any]:
         message = data.get(CONF_MESSAGE)
-        if message_type in {MESSAGE_TYPE_TEXT, MESSAGE_TYPE_MARKDOWN} and not message:
+        if message_type in _BATCHABLE_MESSAGE_TYPES and not message:
             raise WeWorkError("Message content is required for text or markdown messages")
 
         to_user = _merge_recipient(data.get(CONF_TO_USER), self._defaults.get(CONF_TO_USER))
@@ -133,18 +433,7 @@ class WeWorkAppClient(BaseWeWorkClient):
         if not any([to_user, to_party, to_tag]):
             raise WeWorkError("At least one recipient must be provided for the application message")
 
-        payload: dict[str, Any] = {
-            "agentid": self._agent_id,
-            "msgtype": message_type,
-            "safe": 0,
-        }
-
-        if to_user:
-            payload["touser"] = to_user
-        if to_party:
-            payload["toparty"] = to_party
-        if to_tag:
-            payload["totag"] = to_tag
+        payload = {**self._payload_base(message_type, to_user, to_party, to_tag)}
 
         if message_type == MESSAGE_TYPE_TEXT:
             payload[MESSAGE_TYPE_TEXT] = {"content": message}
@@ -158,26 +447,104 @@ class WeWorkAppClient(BaseWeWorkClient):
 
         return payload
 
-    async def _ensure_token(self) -> str:
-        if self._token and time.monotonic() < self._token_expire_time - 30:
+    def _payload_base(
+        self,
+        message_type: str,
+        to_user: str | None,
+        to_party: str | None,
+        to_tag: str | None,
+    ) -> MappingProxyType[str, Any]:
+        key = (message_type, to_user, to_party, to_tag)
+        if (base := self._payload_cache.get(key)) is not None:
+            self._payload_cache.move_to_end(key)
+            return base
+
+        payload: dict[str, Any] = {
+            "agentid": self._agent_id,
+            "msgtype": message_type,
+            "safe": 0,
+        }
+        if to_user:
+            payload["touser"] = to_user
+        if to_party:
+            payload["toparty"] = to_party
+        if to_tag:
+            payload["totag"] = to_tag
+
+        base = self._payload_cache[key] = MappingProxyType(payload)
+        if len(self._payload_cache) > PAYLOAD_CACHE_SIZE:
+            self._payload_cache.popitem(last=False)
+        return base
+
+    @callback
+    def _cached_token(self) -> str | None:
+        now = time.monotonic()
+        if not self._token or now >= self._token_expire_time - 30:
+            return None
+        if self._token_expire_time - now < TOKEN_REFRESH_AHEAD:
+            self._schedule_refresh()
+        return self._token
+
+    async def _retry_token(self, rejected_token: str) -> str:
+        if self._token == rejected_token:
+            # WeCom refused this token; never fall back to it if the refresh fails,
+            # nor restore it from storage after a restart.
+            self._token = None
+            self._token_expire_time = 0
+            await self._store.async_remove()
+        if self._refresh_task is not None and not self._refresh_task.done():
+            # Shared with other senders; one cancelled caller must not cancel it for all.
+            await asyncio.shield(self._refresh_task)
+        if self._token and self._token != rejected_token:
             return self._token
-        return await self._refresh_token(force=False)
+        return await self._refresh_token(force=True)
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Refresh a soon-to-expire token while the current one keeps being used.
+
+        At most one attempt per ``TOKEN_REFRESH_BACKOFF``: a failed refresh, or one
+        where WeCom hands back the same short-lived token, leaves the expiry close
+        and would otherwise trigger another gettoken on every send.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        now = time.monotonic()
+        if (
+            self._refresh_scheduled_at is not None
+            and now - self._refresh_scheduled_at < TOKEN_REFRESH_BACKOFF
+        ):
+            return
+        self._refresh_scheduled_at = now
+        self._refresh_task = self._hass.async_create_background_task(
+            self._async_refresh_in_background(), "wework_notify token refresh"
+        )
+
+    async def _async_refresh_in_background(self) -> str | None:
+        try:
+            return await self._refresh_token(force=True)
+        except (WeWorkError, RuntimeError) as err:
+            # RuntimeError covers a session closed while the refresh was pending.
+            _LOGGER.debug("Background token refresh failed: %s", err)
+            return None
 
     async def _refresh_token(self, force: bool) -> str:
         async with self._token_lock:
             if self._token and not force and time.monotonic() < self._token_expire_time - 30:
                 return self._token
 
-            url = f"{API_BASE_URL}/gettoken"
             try:
-                async with self.session.get(
-                    url,
+                async with asyncio.timeout(DEFAULT_TIMEOUT), self.session.get(
+                    _TOKEN_URL,
                     params={"corpid": self._corp_id, "corpsecret": self._corp_secret},
-                    timeout=DEFAULT_TIMEOUT,
                 ) as resp:
-                    result = await resp.json()
-            except ClientError as err:
-                raise WeWorkError(f"Failed to refresh token: {err}") from err
+                    result = orjson.loads(await resp.read())
+            except (ClientError, TimeoutError, orjson.JSONDecodeError) as err:
+                reason = str(err) or "timed out"
+                if self._token and time.monotonic() < self._token_expire_time:
+                    _LOGGER.warning("Failed to refresh token, using the cached one: %s", reason)
+                    return self._token
+                raise WeWorkError(f"Failed to refresh token: {reason}") from err
 
             errcode = result.get("errcode")
             if errcode:
@@ -191,6 +558,9 @@ class WeWorkAppClient(BaseWeWorkClient):
 
             self._token = access_token
             self._token_expire_time = time.monotonic() + int(expires_in)
+            await self._store.async_save(
+                {"token": access_token, "exp_wall": time.time() + int(expires_in)}
+            )
             return access_token
 
 
@@ -201,22 +571,46 @@ class WeWorkBotClient(BaseWeWorkClient):
         super().__init__(hass)
         self._webhook_key = webhook_key
 
-    async def async_send_message(self, data: dict[str, Any]) -> None:
+    async def async_send_message(self, data: Mapping[str, Any]) -> None:
         message_type: str = data.get(CONF_MESSAGE_TYPE, MESSAGE_TYPE_TEXT)
         if message_type not in SUPPORTED_MESSAGE_TYPES:
             raise WeWorkError(f"Unsupported message type: {message_type}")
 
         payload = self._build_payload(message_type, data)
-        url = f"{API_BASE_URL}/webhook/send"
+        if message_type == MESSAGE_TYPE_IMAGE:
+            # Base64 images can be hundreds of KB; serialize them off the event loop
+            # and identify duplicates without serializing them at all.
+            image = payload[message_type]
+            await self._async_dispatch(
+                payload,
+                None,
+                None,
+                fingerprint=hash((message_type, image["md5"], image["base64"])),
+                offload=True,
+            )
+            return
+
+        # Every message goes to the same webhook, so the robot has a single target.
+        item = payload[message_type]
+        batch_variant = (
+            message_type,
+            tuple(item.get("mentioned_list", ())),
+            tuple(item.get("mentioned_mobile_list", ())),
+        )
+        max_bytes = BOT_MARKDOWN_MAX_BYTES if message_type == MESSAGE_TYPE_MARKDOWN else BOT_TEXT_MAX_BYTES
+        await self._async_dispatch(payload, None, batch_variant, max_bytes=max_bytes)
+
+    async def _async_send_payload(self, payload: dict[str, Any], body: bytes | None = None) -> None:
         try:
-            async with self.session.post(
-                url,
+            async with asyncio.timeout(DEFAULT_TIMEOUT), self.session.post(
+                _WEBHOOK_URL,
                 params={"key": self._webhook_key},
-                json=payload,
-                timeout=DEFAULT_TIMEOUT,
+                **_body_kwargs(payload, body),
             ) as resp:
-                result = await resp.json()
-        except ClientError as err:
+                result = orjson.loads(await resp.read())
+        except TimeoutError as err:
+            raise WeWorkError("Timed out sending message") from err
+        except (ClientError, orjson.JSONDecodeError) as err:
             raise WeWorkError(f"Failed to send message: {err}") from err
 
         errcode = result.get("errcode")
@@ -224,7 +618,7 @@ class WeWorkBotClient(BaseWeWorkClient):
             errmsg = result.get("errmsg", "unknown error")
             raise WeWorkError(f"Message send failed: {errmsg}", errcode=errcode) from _WeWorkAPIError(errcode, errmsg)
 
-    def _build_payload(self, message_type: str, data: dict[str, Any]) -> dict[str, Any]:
+    def _build_payload(self, message_type: str, data: Mapping[str, Any]) -> dict[str, Any]:
         message = data.get(CONF_MESSAGE)
         payload: dict[str, Any]
         if message_type == MESSAGE_TYPE_TEXT:
@@ -263,21 +657,50 @@ class _WeWorkAPIError(Exception):
         super().__init__(f"errcode={errcode}, errmsg={errmsg}")
 
 
+def _json_dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
+def _json_dumps_sorted(obj: Any) -> bytes:
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+
+def _body_kwargs(payload: dict[str, Any], body: bytes | None) -> dict[str, Any]:
+    if body is None:
+        return {"json": payload}
+    return {"data": body, "headers": {hdrs.CONTENT_TYPE: CONTENT_TYPE_JSON}}
+
+
+async def async_remove_token_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the access token persisted for an application entry."""
+    await _token_store(hass, entry_id).async_remove()
+
+
+def _token_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    return Store(hass, TOKEN_STORAGE_VERSION, f"{DOMAIN}_{entry_id}_token")
+
+
+def _merge_payloads(payloads: list[dict[str, Any]]) -> dict[str, Any]:
+    first = payloads[0]
+    if len(payloads) == 1:
+        return first
+    message_type = first["msgtype"]
+    content = BATCH_SEPARATOR.join(payload[message_type]["content"] for payload in payloads)
+    return {**first, message_type: {**first[message_type], "content": content}}
+
+
 def _merge_recipient(override: str | None, default: str | None) -> str | None:
     override = override.strip() if isinstance(override, str) else override
     default = default.strip() if isinstance(default, str) else default
-    if override and default:
-        # WeCom expects recipients separated by '|'. Use unique order preserving merge.
-        existing = []
-        for part in (override.split("|") + default.split("|")):
-            part = part.strip()
-            if part and part not in existing:
-                existing.append(part)
-        return "|".join(existing)
-    return override or default
+    if not override or not default:
+        return override or default
+    # WeCom expects recipients separated by '|'. Use unique order preserving merge.
+    parts = (part.strip() for part in override.split("|") + default.split("|"))
+    return "|".join(dict.fromkeys(part for part in parts if part)) or None
 
 
 def _split_optional(value: str | None) -> list[str] | None:
     if not value:
         return None
-    return [item.strip() for item in value.split("|") if item.strip()]
+    items = [item for item in map(str.strip, value.split("|")) if item]
+    return items or None
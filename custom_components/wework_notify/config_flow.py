@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Final
 
 import voluptuous as vol
 
@@ -26,6 +26,31 @@ from .const import (
     ENTRY_TYPE_BOT,
 )
 
+_USER_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(CONF_NAME): str,
+        vol.Required(CONF_ENTRY_TYPE): vol.In(
+            {
+                ENTRY_TYPE_APP: "WeCom Custom Application",
+                ENTRY_TYPE_BOT: "WeCom Group Robot",
+            }
+        ),
+    }
+)
+
+_APP_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(CONF_CORP_ID, default=""): str,
+        vol.Required(CONF_CORP_SECRET, default=""): str,
+        vol.Required(CONF_AGENT_ID, default=1000000): vol.Coerce(int),
+        vol.Optional(CONF_DEFAULT_TO_USER, default=""): str,
+        vol.Optional(CONF_DEFAULT_TO_PARTY, default=""): str,
+        vol.Optional(CONF_DEFAULT_TO_TAG, default=""): str,
+    }
+)
+
+_BOT_SCHEMA: Final = vol.Schema({vol.Required(CONF_WEBHOOK_KEY): str})
+
 
 class WeWorkNotifyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for WeWork Notify."""
@@ -46,32 +71,11 @@ class WeWorkNotifyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self.async_step_app()
             return await self.async_step_bot()
 
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME): str,
-                vol.Required(CONF_ENTRY_TYPE): vol.In(
-                    {
-                        ENTRY_TYPE_APP: "WeCom Custom Application",
-                        ENTRY_TYPE_BOT: "WeCom Group Robot",
-                    }
-                ),
-            }
-        )
-
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA, errors=errors)
 
     async def async_step_app(self, user_input: dict[str, Any] | None = None) -> config_entries.FlowResult:
         errors: dict[str, str] = {}
 
-        defaults = {
-            CONF_CORP_ID: "",
-            CONF_CORP_SECRET: "",
-            CONF_AGENT_ID: 1000000,
-            CONF_DEFAULT_TO_USER: "",
-            CONF_DEFAULT_TO_PARTY: "",
-            CONF_DEFAULT_TO_TAG: "",
-        }
-
         if user_input is not None:
             corp_id = user_input[CONF_CORP_ID].strip()
             corp_secret = user_input[CONF_CORP_SECRET].strip()
@@ -97,18 +101,7 @@ class WeWorkNotifyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             return self.async_create_entry(title=self._name or "WeWork App", data=data)
 
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_CORP_ID, default=defaults[CONF_CORP_ID]): str,
-                vol.Required(CONF_CORP_SECRET, default=defaults[CONF_CORP_SECRET]): str,
-                vol.Required(CONF_AGENT_ID, default=defaults[CONF_AGENT_ID]): vol.Coerce(int),
-                vol.Optional(CONF_DEFAULT_TO_USER, default=defaults[CONF_DEFAULT_TO_USER]): str,
-                vol.Optional(CONF_DEFAULT_TO_PARTY, default=defaults[CONF_DEFAULT_TO_PARTY]): str,
-                vol.Optional(CONF_DEFAULT_TO_TAG, default=defaults[CONF_DEFAULT_TO_TAG]): str,
-            }
-        )
-
-        return self.async_show_form(step_id="app", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="app", data_schema=_APP_SCHEMA, errors=errors)
 
     async def async_step_bot(self, user_input: dict[str, Any] | None = None) -> config_entries.FlowResult:
         errors: dict[str, str] = {}
@@ -125,8 +118,7 @@ class WeWorkNotifyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             return self.async_create_entry(title=self._name or "WeWork Robot", data=data)
 
-        schema = vol.Schema({vol.Required(CONF_WEBHOOK_KEY): str})
-        return self.async_show_form(step_id="bot", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="bot", data_schema=_BOT_SCHEMA, errors=errors)
 
     @staticmethod
     def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
@@ -37,12 +37,33 @@ CONF_MENTIONED_MOBILE_LIST = "mentioned_mobile_list"
 MESSAGE_TYPE_TEXT = "text"
 MESSAGE_TYPE_MARKDOWN = "markdown"
 MESSAGE_TYPE_IMAGE = "image"
-SUPPORTED_MESSAGE_TYPES = {MESSAGE_TYPE_TEXT, MESSAGE_TYPE_MARKDOWN, MESSAGE_TYPE_IMAGE}
+SUPPORTED_MESSAGE_TYPES = frozenset({MESSAGE_TYPE_TEXT, MESSAGE_TYPE_MARKDOWN, MESSAGE_TYPE_IMAGE})
 
 SERVICE_SEND_MESSAGE = "send_message"
 
-TOKEN_RETRYABLE_ERROR_CODES = {40014, 42001, 40001}
+TOKEN_RETRYABLE_ERROR_CODES = frozenset({40014, 42001, 40001})
+TOKEN_STORAGE_VERSION = 1
+TOKEN_REFRESH_AHEAD = 300
+TOKEN_REFRESH_BACKOFF = 60
 
 API_BASE_URL = "https://qyapi.weixin.qq.com/cgi-bin"
 
 DEFAULT_TIMEOUT = 10
+
+CONNECTION_LIMIT = 8
+CONNECTION_KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 600
+
+PAYLOAD_CACHE_SIZE = 32
+
+DEDUP_WINDOW = 2.0
+DEDUP_CACHE_SIZE = 64
+
+BATCH_MAX_SIZE = 10
+BATCH_WAIT = 0.2
+BATCH_SEPARATOR = "\n---\n"
+
+# WeCom content caps in UTF-8 bytes.
+APP_CONTENT_MAX_BYTES = 2048
+BOT_TEXT_MAX_BYTES = 2048
+BOT_MARKDOWN_MAX_BYTES = 4096